@@ -5,12 +5,27 @@ import sys
 import re
 import functools
 import inspect
+import operator
 import threading
+import types
 
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 
-_patch_lock = threading.Lock()
+# Patches are serialized per parent (class or module) rather than globally, so
+# threads patching unrelated parents do not contend. The stripe count is a power
+# of two so the index can be taken with a mask.
+_STRIPES = 64
+_stripe_locks = [threading.Lock() for _ in range(_STRIPES)]
+_SENTINEL = object()
+_EMPTY_FROZENSET: frozenset = frozenset()
+_get_wrapped = operator.attrgetter('__wrapped__')
+# Attributes copied from the wrapped function onto a new wrapper. Unlike
+# functools.update_wrapper, the wrapped function's __dict__ is not merged in.
+_WRAPPER_ASSIGNMENTS = ('__module__', '__name__', '__qualname__', '__doc__')
+# Method descriptors that draping looks through, mapped to the callable that
+# re-wraps a rebuilt function in the same descriptor type.
+_DESCRIPTOR_WRAP: dict[type, Callable] = {staticmethod: staticmethod, classmethod: classmethod}
 
 
 def _get_parent_and_name(func_obj: Callable) -> tuple[Any, str]:
@@ -40,37 +55,265 @@ def _get_parent_and_name(func_obj: Callable) -> tuple[Any, str]:
         raise TypeError(f"Could not determine parent for {func_obj}") from e
 
 
-def _deconstruct_chain(func_obj: Callable) -> dict:
-    """Deconstructs a function's decorator chain into its core components."""
-    parent, func_name = _get_parent_and_name(func_obj)
-    original_attr = inspect.getattr_static(parent, func_name)
-    is_staticmethod = isinstance(original_attr, staticmethod)
-    is_classmethod = isinstance(original_attr, classmethod)
-    chain, current = [], original_attr
-    while current:
-        chain.append(current)
-        current = getattr(current, '__wrapped__', None)
-    original_func = chain.pop() if chain else original_attr
-    wrappers = list(reversed(chain))
-    decorators = [getattr(w, '_applied_decorator', None) for w in wrappers]
-    descriptor_type = 'static' if is_staticmethod else 'class' if is_classmethod else None
+def _lock_for(parent: Any) -> threading.Lock:
+    """Returns the lock that guards patches applied to the given parent."""
+    return _stripe_locks[(id(parent) >> 4) & (_STRIPES - 1)]
+
+
+def _fast_static_lookup(
+    parent: Any, name: str,
+    _getattr: Callable = getattr, _sentinel: Any = _SENTINEL,
+    _getattr_static: Callable = inspect.getattr_static
+) -> Any:
+    """
+    Looks up an attribute without triggering descriptors, like getattr_static.
+
+    The common case of an attribute defined directly on a class or module is
+    served from its __dict__; anything else falls back to inspect.getattr_static.
+    """
+    d = _getattr(parent, '__dict__', None)
+    if d is not None:
+        v = d.get(name, _sentinel)
+        if v is not _sentinel:
+            return v
+    return _getattr_static(parent, name)
+
+
+def _walk_chain(
+    func: Callable, _get_wrapped: Callable = _get_wrapped
+) -> tuple[Callable, Sequence, Sequence, frozenset]:
+    """
+    Walks the __wrapped__ chain of a function in a single pass.
+
+    A missing or None `__wrapped__` ends the chain.
+
+    Returns the innermost (original) function, the wrappers and the decorators
+    applied to it, both ordered from innermost to outermost (a decorator is None
+    for a wrapper that draping did not create), and a frozenset with the ids of
+    the known decorators.
+    """
+    if getattr(func, '__wrapped__', None) is None:
+        # Not decorated at all: the common case for a first decorate() and for
+        # undecorate() on a plain function, so skip building anything.
+        return func, (), (), _EMPTY_FROZENSET
+    # Both lists are filled outermost first while walking and reversed in place.
+    # The tag is a plain instance attribute, so it is read straight from the
+    # wrapper's __dict__ instead of going through the full getattr protocol.
+    wrappers, decorators, current = [], [], func
+    wrappers_append, decorators_append = wrappers.append, decorators.append
+    while True:
+        try:
+            inner = _get_wrapped(current)
+        except AttributeError:
+            break
+        if inner is None:
+            # __wrapped__ = None marks the end of the chain, not a link in it.
+            break
+        wrappers_append(current)
+        try:
+            decorators_append(current.__dict__.get('_applied_decorator'))
+        except AttributeError:
+            decorators_append(None)
+        current = inner
+    wrappers.reverse()
+    decorators.reverse()
+    applied_ids = frozenset(id(d) for d in decorators if d is not None)
+    return current, wrappers, decorators, applied_ids
+
+
+def _update_wrapper(
+    wrapper: Callable, func: Callable,
+    _assignments: tuple = _WRAPPER_ASSIGNMENTS, _getattr: Callable = getattr,
+    _setattr: Callable = setattr
+) -> None:
+    """
+    Makes the wrapper look like the wrapped function, without merging __dict__.
+
+    Only the attributes draping relies on (the name, qualname and module used to
+    locate the function, and __wrapped__ for the chain) plus __doc__ are copied.
+    """
+    try:
+        # Plain functions have all of them, so assign directly.
+        wrapper.__module__ = func.__module__
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+    except AttributeError:
+        for attr in _assignments:
+            try:
+                value = _getattr(func, attr)
+            except AttributeError:
+                continue
+            _setattr(wrapper, attr, value)
+    wrapper.__wrapped__ = func
+
+
+def _is_full_update(wrapper: Callable) -> bool:
+    """Tells whether the wrapper was built with `full_update_wrapper`."""
+    # The mark is the wrapper's own id, so a value copied from an inner wrapper
+    # by a functools.wraps inside some decorator does not count.
+    return getattr(wrapper, '_full_update', None) == id(wrapper)
+
+
+def _wrap(
+    decorator: Callable, func: Callable, full_update_wrapper: bool = False,
+    inner_ids: Optional[frozenset] = None,
+    _id: Callable = id, _getattr: Callable = getattr,
+    _update_wrapper: Callable = _update_wrapper,
+    _full_update_wrapper: Callable = functools.update_wrapper,
+    _walk_chain: Callable = _walk_chain
+) -> Callable:
+    """
+    Applies a decorator to a function and tags the result for later lookups.
+
+    The wrapper is tagged with the decorator (`_applied_decorator`) and with a
+    frozenset of the ids of all decorators in the chain (`_applied_set`).
+    `inner_ids` is the set already known for `func`, if the caller has it.
+    With `full_update_wrapper`, functools.update_wrapper is used on the wrapper
+    and it is marked as such (`_full_update`) for later rebuilds.
+    """
+    wrapper = decorator(func)
+    if full_update_wrapper:
+        _full_update_wrapper(wrapper, func)
+        wrapper._full_update = _id(wrapper)
+    else:
+        _update_wrapper(wrapper, func)
+    wrapper._applied_decorator = decorator
+    if inner_ids is None:
+        inner_ids = _getattr(func, '_applied_set', None)
+        if inner_ids is None:
+            inner_ids = _walk_chain(func)[3]
+    wrapper._applied_set = inner_ids | {_id(decorator)}
+    return wrapper
+
+
+def _rebuild_chain(chain_info: dict, new_decorators: list) -> Callable:
+    """
+    Rebuilds a deconstructed chain so that it carries `new_decorators`.
+
+    The existing wrappers are reused as they are up to the first decorator that
+    differs, including wrappers that draping did not create. Only the decorators
+    above that point are re-applied; foreign wrappers there cannot be re-targeted
+    to a new inner function and are dropped.
+
+    Each re-applied decorator keeps the update mode (`full_update_wrapper`) of
+    the wrapper at the same position counted from the outermost end, which is
+    the wrapper it replaces for both redecorate() and undecorate().
+    """
+    decorators = chain_info["decorators"]
+    wrappers = chain_info["wrappers"]
+    offset = len(decorators) - len(new_decorators)
+    keep = 0
+    for old, new in zip(decorators, new_decorators):
+        if old is not new:
+            break
+        keep += 1
+    rebuilt_func = wrappers[keep - 1] if keep else chain_info["original_func"]
+    for i in range(keep, len(new_decorators)):
+        deco = new_decorators[i]
+        if deco:
+            rebuilt_func = _wrap(deco, rebuilt_func, _is_full_update(wrappers[i + offset]))
+    return rebuilt_func
+
+
+def _deconstruct_chain(parent: Any, func_name: str) -> dict:
+    """Deconstructs the decorator chain of parent.func_name into its core components.
+
+    Must be called with the parent's lock held, so that the chain is read from
+    the attribute's current state.
+    """
+    original_attr = _fast_static_lookup(parent, func_name)
+    wrap_descriptor = _DESCRIPTOR_WRAP.get(type(original_attr))
+    func = original_attr if wrap_descriptor is None else original_attr.__func__
+    original_func, wrappers, decorators, _ = _walk_chain(func)
     return {
         "parent": parent, "func_name": func_name, "original_attr": original_attr,
-        "original_func": original_func, "decorators": decorators,
-        "descriptor_type": descriptor_type,
+        "original_func": original_func, "wrappers": wrappers, "decorators": decorators,
+        "wrap_descriptor": wrap_descriptor,
     }
 
 
+def _set_patched_attr(
+    parent: Any, name: str, value: Any,
+    _type_setattr: Callable = type.__setattr__, _module_type: type = types.ModuleType
+) -> None:
+    """
+    Stores a patched attribute on its parent.
+
+    Classes are updated through type.__setattr__ and modules through their
+    __dict__, so a __setattr__ defined by a metaclass or a module subclass is not
+    involved. Any other parent goes through the regular setattr().
+    """
+    if isinstance(parent, type):
+        _type_setattr(parent, name, value)
+    elif isinstance(parent, _module_type):
+        parent.__dict__[name] = value
+    else:  # pragma: no cover
+        setattr(parent, name, value)
+
+
+def _decorate_attr(
+    parent: Any, func_name: str, decorator: Callable,
+    decorate_again: bool, full_update_wrapper: bool
+) -> bool:
+    """Applies a decorator to parent.func_name. The parent's lock must be held."""
+    original_attr = _fast_static_lookup(parent, func_name)
+    wrap_descriptor = _DESCRIPTOR_WRAP.get(type(original_attr))
+    func_to_decorate = original_attr
+    if wrap_descriptor is not None:
+        func_to_decorate = original_attr.__func__
+
+    applied_ids = None
+    if not decorate_again:
+        # Wrappers built by draping carry the ids of every decorator below
+        # them; only foreign wrappers need the chain walk.
+        applied_ids = getattr(func_to_decorate, '_applied_set', None)
+        if applied_ids is None:
+            *_, applied_ids = _walk_chain(func_to_decorate)
+        if id(decorator) in applied_ids:
+            return False
+
+    decorated_function = _wrap(decorator, func_to_decorate, full_update_wrapper, applied_ids)
+
+    final_obj = decorated_function
+    if wrap_descriptor is not None:
+        final_obj = wrap_descriptor(decorated_function)
+    _set_patched_attr(parent, func_name, final_obj)
+    return True
+
+
+def _decorate_run(
+    parent: Any, func_names: list[str], results: list[bool], decorator: Callable,
+    decorate_again: bool, raise_on_error: bool, full_update_wrapper: bool
+) -> None:
+    """Decorates several attributes of one parent, holding its lock once."""
+    if not func_names:
+        return
+    with _lock_for(parent):
+        for func_name in func_names:
+            try:
+                results.append(_decorate_attr(
+                    parent, func_name, decorator, decorate_again, full_update_wrapper
+                ))
+            except (TypeError, AttributeError):
+                if raise_on_error:
+                    raise
+                results.append(False)
+
+
 def decorate(
     decorator: Callable, *functions: Callable,
-    decorate_again: bool = False, raise_on_error: bool = True
+    decorate_again: bool = False, raise_on_error: bool = True,
+    full_update_wrapper: bool = False
 ) -> tuple[bool, ...]:
     """Dynamically applies a decorator to one or more functions or methods.
 
     This function monkey-patches the given functions in their original
     modules or classes, wrapping them with the provided decorator. The operation
     is thread-safe and correctly handles regular functions, instance methods,
-    class methods, and static methods.
+    class methods, and static methods. Functions are processed in the given
+    order; consecutive functions that share a parent are patched under a
+    single acquisition of that parent's lock.
 
     Args:
         decorator (Callable): The decorator to apply. This should be a
@@ -84,6 +327,16 @@ def decorate(
         raise_on_error (bool): If True (default), raises TypeError or
             AttributeError on failure. If False, suppresses such exceptions
             and returns False in the result tuple for the failed function.
+        full_update_wrapper (bool): If False (default), only `__module__`,
+            `__name__`, `__qualname__`, `__doc__` and `__wrapped__` are copied
+            to the new wrapper. If True, `functools.update_wrapper` is used,
+            which also copies `__annotations__` and merges the wrapped
+            function's `__dict__` into the wrapper's. Note that the False
+            default is a behaviour change: earlier versions always used
+            `functools.update_wrapper`, so `__annotations__` and `__dict__`
+            are no longer copied unless this is set. The chosen mode is
+            remembered on the wrapper and reused when `redecorate()` or
+            `undecorate()` rebuild it.
 
     Returns:
         tuple[bool, ...]: A tuple of booleans, where each value indicates
@@ -97,44 +350,31 @@ def decorate(
         AttributeError: If a function name cannot be found on its determined
             parent object. Raised only if `raise_on_error` is True.
     """
-    results = []
+    # Consecutive functions that share a parent are patched as one run under a
+    # single acquisition of its lock. Runs are flushed in argument order, so
+    # decorators are called, and errors raised, exactly as for one-by-one calls.
+    results: list[bool] = []
+    run_parent: Any = None
+    run_names: list[str] = []
     for func_obj in functions:
         try:
-            with _patch_lock:
-                parent, func_name = _get_parent_and_name(func_obj)
-                original_attr = inspect.getattr_static(parent, func_name)
-                is_staticmethod = isinstance(original_attr, staticmethod)
-                is_classmethod = isinstance(original_attr, classmethod)
-                func_to_decorate = original_attr.__func__ if (is_staticmethod or is_classmethod) else original_attr
-
-                if not decorate_again:
-                    current_func = original_attr
-                    already_decorated = False
-                    while hasattr(current_func, '__wrapped__'):
-                        if getattr(current_func, '_applied_decorator', None) is decorator:
-                            already_decorated = True
-                            break
-                        current_func = current_func.__wrapped__
-                    if already_decorated:
-                        results.append(False)
-                        continue
-
-                decorated_function = decorator(func_to_decorate)
-                functools.update_wrapper(decorated_function, func_to_decorate)
-                setattr(decorated_function, '_applied_decorator', decorator)
-
-                final_obj = decorated_function
-                if is_staticmethod:
-                    final_obj = staticmethod(decorated_function)
-                elif is_classmethod:
-                    final_obj = classmethod(decorated_function)
-                
-                setattr(parent, func_name, final_obj)
-                results.append(True)
+            parent, func_name = _get_parent_and_name(func_obj)
         except (TypeError, AttributeError):
+            _decorate_run(run_parent, run_names, results, decorator,
+                          decorate_again, raise_on_error, full_update_wrapper)
+            run_names = []
             if raise_on_error:
                 raise
             results.append(False)
+            continue
+        if run_names and parent is not run_parent:
+            _decorate_run(run_parent, run_names, results, decorator,
+                          decorate_again, raise_on_error, full_update_wrapper)
+            run_names = []
+        run_parent = parent
+        run_names.append(func_name)
+    _decorate_run(run_parent, run_names, results, decorator,
+                  decorate_again, raise_on_error, full_update_wrapper)
     return tuple(results)
 
 
@@ -166,8 +406,9 @@ def redecorate(
     results = []
     for func_obj in functions:
         try:
-            with _patch_lock:
-                chain_info = _deconstruct_chain(func_obj)
+            parent, func_name = _get_parent_and_name(func_obj)
+            with _lock_for(parent):
+                chain_info = _deconstruct_chain(parent, func_name)
                 decorators = chain_info["decorators"]
                 if deco1 not in decorators:
                     results.append(False)
@@ -187,24 +428,13 @@ def redecorate(
                     results.append(False)
                     continue
 
-                rebuilt_func = chain_info["original_func"]
-                # --- FIX IS HERE: Re-apply decorators and TAG them ---
-                for deco in new_decorators:
-                    if deco:
-                        new_wrapper = deco(rebuilt_func)
-                        functools.update_wrapper(new_wrapper, rebuilt_func)
-                        setattr(new_wrapper, '_applied_decorator', deco)
-                        rebuilt_func = new_wrapper
-                # --- END OF FIX ---
-
-                descriptor = chain_info["descriptor_type"]
+                rebuilt_func = _rebuild_chain(chain_info, new_decorators)
+
+                wrap_descriptor = chain_info["wrap_descriptor"]
                 final_obj = rebuilt_func
-                if descriptor == 'static':
-                    final_obj = staticmethod(rebuilt_func)
-                elif descriptor == 'class':
-                    final_obj = classmethod(rebuilt_func)
-                
-                setattr(chain_info["parent"], chain_info["func_name"], final_obj)
+                if wrap_descriptor is not None:
+                    final_obj = wrap_descriptor(rebuilt_func)
+                _set_patched_attr(chain_info["parent"], chain_info["func_name"], final_obj)
                 results.append(True)
         except (TypeError, AttributeError):
             if raise_on_error:
@@ -245,8 +475,24 @@ def undecorate(
             Raised only if `raise_on_error` is True.
     """
     try:
-        with _patch_lock:
-            chain_info = _deconstruct_chain(func)
+        parent, func_name = _get_parent_and_name(func)
+        with _lock_for(parent):
+            # Fast path: removing the outermost wrapper only needs its
+            # __wrapped__, so the chain is neither walked nor rebuilt.
+            original_attr = _fast_static_lookup(parent, func_name)
+            wrap_descriptor = _DESCRIPTOR_WRAP.get(type(original_attr))
+            top = original_attr if wrap_descriptor is None else original_attr.__func__
+            inner = getattr(top, '__wrapped__', None)
+            if inner is not None and decorator_to_remove is not None:
+                top_decorator = getattr(top, '__dict__', {}).get('_applied_decorator')
+                if top_decorator is not decorator_to_remove:
+                    inner = None
+            if inner is not None:
+                final_obj = inner if wrap_descriptor is None else wrap_descriptor(inner)
+                _set_patched_attr(parent, func_name, final_obj)
+                return True
+
+            chain_info = _deconstruct_chain(parent, func_name)
             decorators = chain_info["decorators"]
             if not decorators: return False
 
@@ -261,30 +507,23 @@ def undecorate(
                     new_decorators.pop()
                     changed = True
             else:
-                for i in range(len(new_decorators) - 1, -1, -1):
-                    if new_decorators[i] is decorator_to_remove:
-                        new_decorators.pop(i)
-                        changed = True
-                        break
+                rev_idx = next(
+                    (i for i, d in enumerate(reversed(new_decorators)) if d is decorator_to_remove),
+                    None
+                )
+                if rev_idx is not None:
+                    del new_decorators[-1 - rev_idx]
+                    changed = True
             
             if not changed: return False
 
-            rebuilt_func = chain_info["original_func"]
-            for deco in new_decorators:
-                if deco:
-                    new_wrapper = deco(rebuilt_func)
-                    functools.update_wrapper(new_wrapper, rebuilt_func)
-                    setattr(new_wrapper, '_applied_decorator', deco)
-                    rebuilt_func = new_wrapper
+            rebuilt_func = _rebuild_chain(chain_info, new_decorators)
 
-            descriptor = chain_info["descriptor_type"]
+            wrap_descriptor = chain_info["wrap_descriptor"]
             final_obj = rebuilt_func
-            if descriptor == 'static':
-                final_obj = staticmethod(rebuilt_func)
-            elif descriptor == 'class':
-                final_obj = classmethod(rebuilt_func)
-            
-            setattr(chain_info["parent"], chain_info["func_name"], final_obj)
+            if wrap_descriptor is not None:
+                final_obj = wrap_descriptor(rebuilt_func)
+            _set_patched_attr(chain_info["parent"], chain_info["func_name"], final_obj)
             return True
     except (TypeError, AttributeError):
         if raise_on_error:
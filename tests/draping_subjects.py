@@ -52,3 +52,11 @@ class MyAsyncClass:
     async def class_method(cls): await asyncio.sleep(0); cls._log.append("class_method_run")
     @staticmethod
     async def static_method(): await asyncio.sleep(0); MyAsyncClass._log.append("static_method_run")
+
+
+class _FrozenMeta(type):
+    def __setattr__(cls, name, value):
+        raise AttributeError(f"{cls.__name__} is frozen")
+
+class FrozenClass(metaclass=_FrozenMeta):
+    def method(self): return "method_run"
@@ -187,3 +187,260 @@ class TestDrapingSync:
         with pytest.raises(TypeError):
             undecorate(not_a_function)
         assert undecorate(not_a_function, raise_on_error=False) is False
+
+    def test_undecorate_static_and_class_methods(self):
+        """
+        The staticmethod/classmethod descriptor must not be treated as a
+        link of the wrapper chain when undecorating.
+        """
+        log = subjects.MyClass._log
+        class_deco = subjects.simple_decorator_factory("class_deco", log)
+        decorate(class_deco, subjects.MyClass.class_method, subjects.MyClass.static_method)
+
+        assert undecorate(subjects.MyClass.static_method, class_deco, if_topmost=True) is True
+        assert undecorate(subjects.MyClass.class_method) is True
+        subjects.MyClass.static_method(); subjects.MyClass.class_method()
+        assert log == ["static_method_run", "class_method_run"]
+        assert undecorate(subjects.MyClass.static_method, raise_on_error=False) is False
+
+    def test_concurrent_decorate_same_parent(self):
+        """
+        Threads patching the same function are serialized by the parent's lock,
+        so the decorator is applied exactly once.
+        """
+        import threading
+
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.extend(decorate(subjects.deco_g1, subjects.my_func_g))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+
+        assert results.count(True) == 1
+        subjects.my_func_g(); assert subjects.log_g_sync == ["deco1", "my_func_run"]
+
+    def test_rebuild_reuses_unchanged_wrappers(self):
+        """
+        Rebuilding a chain keeps the wrappers below the changed decorator
+        instead of re-invoking their decorators.
+        """
+        decorate(subjects.deco_g1, subjects.my_func_g)
+        decorate(subjects.deco_g2, subjects.my_func_g)
+        decorate(subjects.deco_g3, subjects.my_func_g)
+        deco1_wrapper = subjects.my_func_g.__wrapped__.__wrapped__
+
+        assert undecorate(subjects.my_func_g, subjects.deco_g2) is True
+        assert subjects.my_func_g.__wrapped__ is deco1_wrapper
+        assert redecorate(subjects.deco_g3, subjects.deco_g2, subjects.my_func_g) == (True,)
+        assert subjects.my_func_g.__wrapped__ is deco1_wrapper
+        subjects.my_func_g(); assert subjects.log_g_sync == ["deco2", "deco1", "my_func_run"]
+
+    def test_wrapper_attributes(self):
+        """
+        By default only the identifying attributes are copied onto a wrapper;
+        full_update_wrapper=True falls back to functools.update_wrapper.
+        """
+        def bare_decorator(func):
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+            return wrapper
+
+        subjects.my_func_g.marker = "original"
+        assert decorate(bare_decorator, subjects.my_func_g) == (True,)
+        assert subjects.my_func_g.__qualname__ == "my_func_g"
+        assert subjects.my_func_g.__module__ == subjects.__name__
+        assert not hasattr(subjects.my_func_g, "marker")
+        assert undecorate(subjects.my_func_g) is True
+
+        assert decorate(bare_decorator, subjects.my_func_g, full_update_wrapper=True) == (True,)
+        assert subjects.my_func_g.marker == "original"
+        assert undecorate(subjects.my_func_g) is True
+        assert not hasattr(subjects.my_func_g, "__wrapped__")
+
+    def test_applied_set_tracks_chain(self):
+        """
+        Every draping wrapper carries the ids of all decorators below it, and
+        the set follows the chain through redecorate() and undecorate().
+        """
+        decorate(subjects.deco_g1, subjects.my_func_g)
+        decorate(subjects.deco_g2, subjects.my_func_g)
+        assert subjects.my_func_g._applied_set == {id(subjects.deco_g1), id(subjects.deco_g2)}
+
+        assert redecorate(subjects.deco_g1, subjects.deco_g3, subjects.my_func_g) == (True,)
+        assert subjects.my_func_g._applied_set == {id(subjects.deco_g3), id(subjects.deco_g2)}
+        assert decorate(subjects.deco_g1, subjects.my_func_g) == (True,)
+        assert decorate(subjects.deco_g3, subjects.my_func_g) == (False,)
+
+        assert undecorate(subjects.my_func_g, subjects.deco_g3) is True
+        assert subjects.my_func_g._applied_set == {id(subjects.deco_g1), id(subjects.deco_g2)}
+
+    def test_rebuild_keeps_foreign_wrappers_below_change(self):
+        """
+        A wrapper draping did not create survives undecorate() and redecorate()
+        as long as the change happens above it.
+        """
+        import functools
+
+        original = subjects.my_func_g
+
+        @functools.wraps(original)
+        def foreign():
+            subjects.log_g_sync.append("foreign")
+            return original()
+
+        subjects.my_func_g = foreign
+        decorate(subjects.deco_g1, subjects.my_func_g)
+        decorate(subjects.deco_g2, subjects.my_func_g)
+
+        assert redecorate(subjects.deco_g2, subjects.deco_g3, subjects.my_func_g) == (True,)
+        subjects.my_func_g(); assert subjects.log_g_sync == ["deco3", "deco1", "foreign", "my_func_run"]
+        subjects.log_g_sync.clear()
+        assert undecorate(subjects.my_func_g, subjects.deco_g1) is True
+        subjects.my_func_g(); assert subjects.log_g_sync == ["deco3", "foreign", "my_func_run"]
+
+    def test_undecorate_topmost_restores_inner_wrapper(self):
+        """
+        Removing the outermost decorator puts the wrapper beneath it back in
+        place without rebuilding the chain.
+        """
+        decorate(subjects.deco_g1, subjects.my_func_g)
+        decorate(subjects.deco_g2, subjects.my_func_g)
+        inner = subjects.my_func_g.__wrapped__
+
+        assert undecorate(subjects.my_func_g, subjects.deco_g2) is True
+        assert subjects.my_func_g is inner
+        assert undecorate(subjects.my_func_g) is True
+        assert not hasattr(subjects.my_func_g, "__wrapped__")
+        assert undecorate(subjects.my_func_g) is False
+
+    def test_decorate_mixed_parents_keeps_result_order(self):
+        """
+        Functions are patched grouped by parent, but results still follow the
+        order in which the functions were passed.
+        """
+        assert decorate(
+            subjects.deco_g1,
+            subjects.MyClass.instance_method, 123, subjects.my_func_g,
+            subjects.MyClass.static_method, subjects.my_func_g,
+            raise_on_error=False,
+        ) == (True, False, True, True, False)
+        subjects.my_func_g(); assert subjects.log_g_sync == ["deco1", "my_func_run"]
+
+    def test_patch_bypasses_metaclass_setattr(self):
+        """
+        Patching writes through type.__setattr__, so a metaclass __setattr__
+        override does not interfere.
+        """
+        deco = subjects.simple_decorator_factory("frozen_deco")
+        assert decorate(deco, subjects.FrozenClass.method) == (True,)
+        assert subjects.FrozenClass().method() == "method_run"
+        assert subjects.log_g_sync == ["frozen_deco"]
+        assert undecorate(subjects.FrozenClass.method) is True
+        assert not hasattr(subjects.FrozenClass.method, "__wrapped__")
+
+    def test_decorate_always_invokes_decorator(self):
+        """
+        Re-decorating a function calls the decorator again and installs a new
+        wrapper, even if an earlier wrapper is still referenced somewhere.
+        """
+        calls = []
+
+        def counting(func):
+            calls.append(func)
+            return subjects.deco_g1(func)
+
+        decorate(counting, subjects.my_func_g)
+        saved = subjects.my_func_g
+        assert undecorate(subjects.my_func_g) is True
+        decorate(counting, subjects.my_func_g)
+        assert len(calls) == 2
+        assert subjects.my_func_g is not saved
+
+    def test_full_update_wrapper_survives_rebuild(self):
+        """
+        Wrappers rebuilt by redecorate() and undecorate() keep the update mode
+        they were originally built with.
+        """
+        def bare_factory(name):
+            def decorator(func):
+                def wrapper(*args, **kwargs):
+                    subjects.log_g_sync.append(name)
+                    return func(*args, **kwargs)
+                return wrapper
+            return decorator
+
+        bare1, bare2 = bare_factory("bare1"), bare_factory("bare2")
+        subjects.my_func_g.marker = "m"
+        decorate(bare1, subjects.my_func_g, full_update_wrapper=True)
+        decorate(subjects.deco_g1, subjects.my_func_g)
+        assert subjects.my_func_g.marker == "m"
+
+        assert redecorate(bare1, bare2, subjects.my_func_g) == (True,)
+        assert subjects.my_func_g.__wrapped__.marker == "m"
+        from draping import draping as core
+        assert core._is_full_update(subjects.my_func_g.__wrapped__)
+        # deco_g1 copies the inner wrapper's __dict__ itself, mark included
+        assert not core._is_full_update(subjects.my_func_g)
+
+        assert undecorate(subjects.my_func_g, subjects.deco_g1) is True
+        assert subjects.my_func_g.marker == "m"
+        subjects.my_func_g(); assert subjects.log_g_sync == ["bare2", "my_func_run"]
+
+    def test_draped_class_is_not_pinned(self):
+        """
+        A draped class replaced by a module reload can be garbage collected.
+        """
+        import gc
+        import weakref
+
+        decorate(subjects.deco_g1, subjects.MyClass.instance_method)
+        class_ref = weakref.ref(subjects.MyClass)
+        importlib.reload(subjects)
+        gc.collect()
+
+        assert class_ref() is None
+
+    def test_none_wrapped_is_not_a_chain_link(self):
+        """
+        A `__wrapped__` set to None ends the chain instead of being unwrapped.
+        """
+        original = subjects.my_func_g
+        original.__wrapped__ = None
+        assert undecorate(subjects.my_func_g) is False
+        assert subjects.my_func_g is original
+
+        decorate(subjects.deco_g1, subjects.my_func_g)
+        decorate(subjects.deco_g2, subjects.my_func_g)
+        assert undecorate(subjects.my_func_g, subjects.deco_g1) is True
+        assert subjects.my_func_g.__wrapped__ is original
+
+    def test_decorate_follows_argument_order(self):
+        """
+        Decorators are applied in argument order, and an error stops at the
+        failing function with everything before it already patched.
+        """
+        seen = []
+
+        def recording(func):
+            seen.append(func.__name__)
+            if func.__name__ == "static_method":
+                raise TypeError("refused")
+            return subjects.deco_g1(func)
+
+        with pytest.raises(TypeError, match="refused"):
+            decorate(recording, subjects.MyClass.instance_method, subjects.my_func_g,
+                     subjects.MyClass.class_method, subjects.MyClass.static_method,
+                     subjects.MyClass.instance_method)
+        assert seen == ["instance_method", "my_func_g", "class_method", "static_method"]
+        assert hasattr(subjects.MyClass.class_method, "__wrapped__")
+
+        importlib.reload(subjects)
+        with pytest.raises(TypeError):
+            decorate(subjects.deco_g1, subjects.my_func_g, 42, subjects.MyClass.instance_method)
+        assert hasattr(subjects.my_func_g, "__wrapped__")
+        assert not hasattr(subjects.MyClass.instance_method, "__wrapped__")